@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 import inspect
+from functools import lru_cache
 
 import sphinx_autodoc_typehints
 
@@ -22,16 +23,36 @@ from uberjob import __version__ as version
 original_format_annotation = sphinx_autodoc_typehints.format_annotation
 
 
+rewrites = {}
+
+
+@lru_cache(maxsize=None)
+def get_class_rewrite(annotation):
+    full_name = f"{annotation.__module__}.{annotation.__qualname__}"
+    package_name, *_, class_name = full_name.split(".")
+    if package_name in ["networkx", "uberjob"]:
+        return f":py:class:`~{package_name}.{class_name}`"
+    return None
+
+
 def format_annotation(annotation, *args, **kwargs):
-    original = original_format_annotation(annotation, *args, **kwargs)
     if inspect.isclass(annotation):
-        full_name = f"{annotation.__module__}.{annotation.__qualname__}"
-        package_name, *_, class_name = full_name.split(".")
-        if package_name in ["networkx", "uberjob"]:
-            modified = f":py:class:`~{package_name}.{class_name}`"
-            print(f"Rewrite: {original} => {modified}")
+        modified = get_class_rewrite(annotation)
+        if modified is not None:
+            if annotation not in rewrites:
+                original = original_format_annotation(annotation, *args, **kwargs)
+                rewrites[annotation] = original, modified
             return modified
-    return original
+    return original_format_annotation(annotation, *args, **kwargs)
+
+
+def print_rewrites(app, exception):
+    for original, modified in rewrites.values():
+        print(f"Rewrite: {original} => {modified}")
+
+
+def setup(app):
+    app.connect("build-finished", print_rewrites)
 
 
 sphinx_autodoc_typehints.format_annotation = format_annotation
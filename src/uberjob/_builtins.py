@@ -23,7 +23,7 @@ def gather_list(*args):
 
 
 def gather_tuple(*args):
-    return tuple(args)
+    return args
 
 
 def gather_set(*args):
@@ -49,7 +49,11 @@ def source():
 
 
 def unpack(iterable, length):
-    t = tuple(itertools.islice(iterable, length + 1))
+    if type(iterable) in (tuple, list):
+        # Sized built-in sequences can be checked directly; tuple() returns a tuple argument unchanged.
+        t = tuple(iterable)
+    else:
+        t = tuple(itertools.islice(iterable, length + 1))
     if len(t) < length:
         raise ValueError(
             f"not enough values to unpack (expected {length}, got {len(t)})"
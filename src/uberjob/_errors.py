@@ -39,15 +39,39 @@ class CallError(Exception):
     """
 
     def __init__(self, call: Call):
-        super().__init__(
-            "\n".join(
+        super().__init__()
+        self.call = call
+        self._is_message_rendered = False
+
+    def _render_message(self):
+        # Rendering the traceback is deferred, since most errors are discarded when max_errors is exceeded.
+        if not self._is_message_rendered:
+            message = "\n".join(
                 [
-                    f"An exception was raised in a symbolic call to {fully_qualified_name(call.fn)}.",
-                    render_symbolic_traceback(call.stack_frame),
+                    f"An exception was raised in a symbolic call to {fully_qualified_name(self.call.fn)}.",
+                    render_symbolic_traceback(self.call.stack_frame),
                 ]
             )
-        )
-        self.call = call
+            BaseException.args.__set__(self, (message,))
+            self._is_message_rendered = True
+
+    @property
+    def args(self):
+        self._render_message()
+        return super().args
+
+    @args.setter
+    def args(self, value):
+        self._is_message_rendered = True
+        BaseException.args.__set__(self, value)
+
+    def __str__(self):
+        self._render_message()
+        return super().__str__()
+
+    def __repr__(self):
+        self._render_message()
+        return super().__repr__()
 
     def __reduce__(self):
         return CallError, (self.call,)
@@ -13,84 +13,154 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import networkx as nx
-
-from uberjob._util.networkx_util import topological_sort
 from uberjob.graph import Dependency, Literal
 
 
-def get_special_connected_components(graph):
-    union_find = nx.utils.UnionFind(graph.nodes)
-    for u, v, k in graph.edges(keys=True):
-        if type(u) is not Literal and type(k) is not Dependency:
-            union_find.union(u, v)
-    return union_find.to_sets()
+def _find(parent, i):
+    root = i
+    while parent[root] != root:
+        root = parent[root]
+    while parent[i] != root:
+        parent[i], i = root, parent[i]
+    return root
 
 
-def condense_graph(graph, representative_to_component_mapping):
-    node_to_representative_mapping = {
-        node: representative
-        for representative, nodes in representative_to_component_mapping.items()
-        for node in nodes
-    }
-    g = nx.DiGraph()
-    for node in graph.nodes:
-        g.add_node(node_to_representative_mapping[node])
-    for u, v in graph.edges():
-        u = node_to_representative_mapping[u]
-        v = node_to_representative_mapping[v]
-        if u != v:
-            g.add_edge(u, v)
-    return g
-
-
-def pred_search(graph, nodes):
-    visited = set()
-    nodes.reverse()
-    while nodes:
-        node = nodes.pop()
-        if node in visited:
-            continue
-        yield node
-        for predecessor in graph.pred[node]:
-            nodes.append(predecessor)
-        visited.add(node)
+def get_argument_edges(graph):
+    """Return the (u, v) pairs of all edges that are not plain dependencies."""
+    return [(u, v) for u, v, k in graph.edges(keys=True) if type(k) is not Dependency]
 
 
-def get_components_graph_and_mapping(graph):
+def get_special_component_ids(nodes, node_ids, argument_edges):
     """
-    Return the contracted connected components graph and the mapping from nodes in the contracted graph to all of the
-    nodes in the original graph that were contracted into them.
+    Return the connected component id of each node id, ignoring non-argument edges and outgoing edges of Literals.
+
+    Component ids are dense and numbered in order of first appearance.
     """
-    representative_to_component_mapping = {
-        next(iter(component)): component
-        for component in get_special_connected_components(graph)
-    }
-    components_graph = condense_graph(graph, representative_to_component_mapping)
-    return components_graph, representative_to_component_mapping
+    parent = list(range(len(nodes)))
+    rank = [0] * len(nodes)
+    for u, v in argument_edges:
+        if type(u) is not Literal:
+            a = _find(parent, node_ids[u])
+            b = _find(parent, node_ids[v])
+            if a != b:
+                if rank[a] < rank[b]:
+                    a, b = b, a
+                parent[b] = a
+                if rank[a] == rank[b]:
+                    rank[a] += 1
+    dense_ids = {}
+    return [
+        dense_ids.setdefault(_find(parent, i), len(dense_ids))
+        for i in range(len(nodes))
+    ]
 
 
-def get_condensation_graph_and_mapping(graph):
+def contract(edge_ids, group_ids, group_count):
     """
-    Return the condensation graph and the mapping from nodes in the condensation graph to all of the nodes in the
-    original graph that were contracted into them.
+    Return the successors of each vertex of the directed graph formed by contracting each group of node ids to a
+    single vertex. The successors of a vertex are the keys of a dict, which serves as an ordered set.
     """
-    (
-        components_graph,
-        representative_to_component_mapping,
-    ) = get_components_graph_and_mapping(graph)
-    representative_to_strong_component_mapping = {
-        next(iter(component)): [
-            node
-            for representative in component
-            for node in representative_to_component_mapping[representative]
-        ]
-        for component in nx.algorithms.strongly_connected_components(components_graph)
-    }
-    condensation_graph = condense_graph(
-        graph, representative_to_strong_component_mapping
-    )
-    return condensation_graph, representative_to_strong_component_mapping
+    successors = [{} for _ in range(group_count)]
+    for u, v in edge_ids:
+        a = group_ids[u]
+        b = group_ids[v]
+        if a != b:
+            successors[a][b] = None
+    return successors
+
+
+def get_strong_component_ids(successors):
+    """
+    Return the strongly connected component id of each vertex of a directed graph given by its successors.
+
+    This is an iterative version of Tarjan's algorithm.
+    """
+    n = len(successors)
+    indexes = [-1] * n
+    lowlinks = [0] * n
+    on_stack = bytearray(n)
+    stack = []
+    component_ids = [-1] * n
+    component_count = 0
+    index_counter = iter(range(n))
+
+    def visit(v):
+        indexes[v] = lowlinks[v] = next(index_counter)
+        stack.append(v)
+        on_stack[v] = 1
+        return v, iter(successors[v])
+
+    for root in range(n):
+        if indexes[root] != -1:
+            continue
+        work = [visit(root)]
+        while work:
+            v, successor_iter = work[-1]
+            for w in successor_iter:
+                if indexes[w] == -1:
+                    work.append(visit(w))
+                    break
+                if on_stack[w]:
+                    lowlinks[v] = min(lowlinks[v], indexes[w])
+            else:
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    lowlinks[u] = min(lowlinks[u], lowlinks[v])
+                if lowlinks[v] == indexes[v]:
+                    w = None
+                    while w != v:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component_ids[w] = component_count
+                    component_count += 1
+    return component_ids
+
+
+def pred_search(predecessor_ids, ids):
+    """
+    Yield the given node ids followed by the ids of their ancestors in depth-first order, visiting each id once.
+
+    :param predecessor_ids: The predecessor ids of each node id.
+    :param ids: The node ids to start from.
+    """
+    visited = bytearray(len(predecessor_ids))
+    stack = ids[::-1]
+    while stack:
+        i = stack.pop()
+        if visited[i]:
+            continue
+        visited[i] = 1
+        yield i
+        stack.extend(predecessor_ids[i])
+
+
+def get_condensation_mapping(condensation_ids):
+    """Return a mapping from each condensation id to its node ids, in order of first appearance."""
+    condensation_mapping = {}
+    for i, c in enumerate(condensation_ids):
+        condensation_mapping.setdefault(c, []).append(i)
+    return condensation_mapping
+
+
+def get_condensation_order(edge_ids, condensation_ids, condensation_mapping):
+    """Return the condensation ids in topological order."""
+    successors = contract(edge_ids, condensation_ids, len(condensation_mapping))
+    pred_counts = [0] * len(successors)
+    for successor_ids in successors:
+        for c in successor_ids:
+            pred_counts[c] += 1
+    # Kahn's algorithm, visiting ready ids in the same order as topological_sort.
+    stack = [c for c in condensation_mapping if not pred_counts[c]]
+    order = []
+    while stack:
+        c = stack.pop()
+        order.append(c)
+        for successor in successors[c]:
+            pred_counts[successor] -= 1
+            if not pred_counts[successor]:
+                stack.append(successor)
+    return order
 
 
 def get_priority_mapping(graph):
@@ -118,17 +188,29 @@ def get_priority_mapping(graph):
     Each pseudo-sink and its ancestors are prioritized in order.
     Pseudo-sinks are nodes with no outgoing argument edges,
     """
-    (
-        condensation_graph,
-        representative_to_component_mapping,
-    ) = get_condensation_graph_and_mapping(graph)
-    pseudo_sinks = [
-        node
-        for representative in topological_sort(condensation_graph)
-        for node in representative_to_component_mapping[representative]
-        if all(
-            type(edge_key) is Dependency
-            for u, v, edge_key in graph.out_edges(node, keys=True)
+    nodes = list(graph.nodes)
+    node_ids = {node: i for i, node in enumerate(nodes)}
+    argument_edges = get_argument_edges(graph)
+    edge_ids = [(node_ids[u], node_ids[v]) for u, v in graph.edges()]
+    component_ids = get_special_component_ids(nodes, node_ids, argument_edges)
+    component_count = max(component_ids, default=-1) + 1
+    strong_ids = get_strong_component_ids(
+        contract(edge_ids, component_ids, component_count)
+    )
+    condensation_ids = [strong_ids[c] for c in component_ids]
+    condensation_mapping = get_condensation_mapping(condensation_ids)
+    argument_sources = {node_ids[u] for u, _ in argument_edges}
+    pseudo_sink_ids = [
+        i
+        for c in get_condensation_order(
+            edge_ids, condensation_ids, condensation_mapping
         )
+        for i in condensation_mapping[c]
+        if i not in argument_sources
     ]
-    return {node: index for index, node in enumerate(pred_search(graph, pseudo_sinks))}
+    pred = graph.pred
+    predecessor_ids = [[node_ids[p] for p in pred[node]] for node in nodes]
+    return {
+        nodes[i]: index
+        for index, i in enumerate(pred_search(predecessor_ids, pseudo_sink_ids))
+    }
@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 """Functionality for running a function on a graph in parallel in topological order using a thread pool"""
+import itertools
 import os
 import threading
 from contextlib import contextmanager
@@ -53,16 +54,24 @@ def thread(fn):
 DONE = object()
 
 
-def worker_thread(queue, process_item):
+def worker_thread(queue, process_item, worker_count):
     def process_items():
         while True:
-            item = queue.get()
+            items = queue.get_batch(worker_count)
+            done_count = 0
             try:
-                if item is DONE:
-                    return
-                process_item(item)
+                for item in items:
+                    if item is DONE:
+                        done_count += 1
+                    else:
+                        process_item(item)
             finally:
-                queue.task_done()
+                queue.task_done(len(items))
+            if done_count:
+                # Hand back any sentinels that were meant for other workers.
+                for _ in range(done_count - 1):
+                    queue.put(DONE)
+                return
 
     return thread(process_items)
 
@@ -72,24 +81,39 @@ def worker_pool(queue, process_item, worker_count):
     workers = []
     try:
         for _ in range(worker_count):
-            workers.append(worker_thread(queue, process_item))
+            workers.append(worker_thread(queue, process_item, worker_count))
         yield
     finally:
         for worker in workers:
             worker.join()
 
 
+def run_inline(queue, process_item):
+    """Process items on the calling thread until the queue is drained."""
+    while not queue.empty():
+        items = queue.get_batch(1)
+        try:
+            for item in items:
+                process_item(item)
+        finally:
+            queue.task_done(len(items))
+
+
 class PreparedNodes(NamedTuple):
     source_nodes: list[Node]
     single_parent_nodes: set[Node]
     remaining_pred_count_mapping: dict[Node, int]
+    successors_mapping: dict[Node, tuple[Node, ...]]
 
 
 def prepare_nodes(graph) -> PreparedNodes:
     source_nodes = []
     single_parent_nodes = set()
     remaining_pred_count_mapping = {}
+    successors_mapping = {}
+    succ = graph.succ
     for node in graph:
+        successors_mapping[node] = tuple(succ[node])
         count = predecessor_count(graph, node)
         if count == 0:
             source_nodes.append(node)
@@ -98,10 +122,30 @@ def prepare_nodes(graph) -> PreparedNodes:
         else:
             remaining_pred_count_mapping[node] = count
     return PreparedNodes(
-        source_nodes, single_parent_nodes, remaining_pred_count_mapping
+        source_nodes,
+        single_parent_nodes,
+        remaining_pred_count_mapping,
+        successors_mapping,
     )
 
 
+def get_ready_successors(
+    successors, single_parent_nodes, remaining_pred_count_mapping, lock
+) -> list[Node]:
+    """Record that a node has completed and return those of its successors that have become ready."""
+    ready_successors = []
+    for successor in successors:
+        if successor in single_parent_nodes:
+            ready_successors.append(successor)
+        else:
+            with lock:
+                remaining_pred_count = remaining_pred_count_mapping[successor] - 1
+                remaining_pred_count_mapping[successor] = remaining_pred_count
+            if not remaining_pred_count:
+                ready_successors.append(successor)
+    return ready_successors
+
+
 def coerce_node_error(node: Node, exception: Exception) -> NodeError:
     if isinstance(exception, NodeError):
         return exception
@@ -117,50 +161,60 @@ def run_function_on_graph(
     worker_count = coerce_worker_count(worker_count)
     max_errors = coerce_max_errors(max_errors)
 
-    source_nodes, single_parent_nodes, remaining_pred_count_mapping = prepare_nodes(
-        graph
-    )
+    (
+        source_nodes,
+        single_parent_nodes,
+        remaining_pred_count_mapping,
+        successors_mapping,
+    ) = prepare_nodes(graph)
     remaining_pred_count_lock = threading.Lock()
 
-    stop = False
+    stop = threading.Event()
     first_node_error = None
-    error_count = 0
-    failure_lock = threading.Lock()
+    # next() on itertools.count is atomic, so each failure gets a distinct count without taking a lock.
+    error_counter = itertools.count(1)
 
     queue = create_queue(graph, source_nodes, scheduler)
+    # Bound once, since process_node runs for every node.
+    is_stopped = stop.is_set
+    put_many = queue.put_many
+    # A single worker runs on the calling thread, where CTRL+C must propagate rather than count as a node failure.
+    inline = worker_count == 1
+    propagated_exception_types = (KeyboardInterrupt,) if inline else ()
 
     def process_node(node):
-        nonlocal stop
         nonlocal first_node_error
-        nonlocal error_count
-        if stop:
+        if is_stopped():
             return
         try:
             fn(node)
+        except propagated_exception_types:
+            raise
         except BaseException as exception:
-            with failure_lock:
-                error_count += 1
-                if not first_node_error:
-                    first_node_error = coerce_node_error(node, exception)
-                if max_errors is not None and error_count > max_errors:
-                    stop = True
+            error_count = next(error_counter)
+            if error_count == 1:
+                first_node_error = coerce_node_error(node, exception)
+            if max_errors is not None and error_count > max_errors:
+                stop.set()
         else:
-            for successor in graph.successors(node):
-                if successor in single_parent_nodes:
-                    queue.put(successor)
-                else:
-                    with remaining_pred_count_lock:
-                        remaining_pred_count_mapping[successor] -= 1
-                        if remaining_pred_count_mapping[successor] == 0:
-                            queue.put(successor)
-
-    with worker_pool(queue, process_node, worker_count):
-        try:
-            queue.join()
-        finally:
-            stop = True
-            for _ in range(worker_count):
-                queue.put(DONE)
+            ready_successors = get_ready_successors(
+                successors_mapping[node],
+                single_parent_nodes,
+                remaining_pred_count_mapping,
+                remaining_pred_count_lock,
+            )
+            if ready_successors:
+                put_many(ready_successors)
+
+    if inline:
+        run_inline(queue, process_node)
+    else:
+        with worker_pool(queue, process_node, worker_count):
+            try:
+                queue.join()
+            finally:
+                stop.set()
+                queue.put_many([DONE] * worker_count)
 
     if first_node_error:
         raise first_node_error
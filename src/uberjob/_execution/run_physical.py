@@ -41,36 +41,82 @@ class BoundCall:
 
     def run(self, fn, retry):
         args = [arg.value for arg in self.args]
+        if not self.kwargs:
+            self.result.value = retry(fn)(*args)
+            return
         kwargs = {name: arg.value for name, arg in self.kwargs.items()}
         self.result.value = retry(fn)(*args, **kwargs)
 
 
 def _create_bound_call(
-    graph: Graph, call: Call, result_lookup: dict[Node, Any]
+    graph: Graph, call: Call, get_result: Callable[[Node], Any]
 ) -> BoundCall:
+    if not graph.pred[call]:
+        return BoundCall((), {}, get_result(call))
     args, kwargs = get_argument_nodes(graph, call)
-    args = [result_lookup[predecessor] for predecessor in args]
-    kwargs = {name: result_lookup[predecessor] for name, predecessor in kwargs.items()}
-    result = result_lookup[call]
+    args = tuple(get_result(predecessor) for predecessor in args)
+    kwargs = {name: get_result(predecessor) for name, predecessor in kwargs.items()}
+    result = get_result(call)
     return BoundCall(args, kwargs, result)
 
 
 def _create_bound_call_lookup_and_output_slot(
     plan: Plan, output_node: Node | None = None
 ):
-    result_lookup = {
-        node: node if type(node) is Literal else Slot(None)
-        for node in plan.graph.nodes()
-    }
+    graph = plan.graph
+    # Result slots are created on demand, so the graph is only walked once.
+    result_lookup = {}
+
+    def get_result(node):
+        result = result_lookup.get(node)
+        if result is None:
+            # Literal values are copied into slots so every argument is read from a Slot.
+            result = Slot(node.value if type(node) is Literal else None)
+            result_lookup[node] = result
+        return result
+
     bound_call_lookup = {
-        node: Slot(_create_bound_call(plan.graph, node, result_lookup))
-        for node in plan.graph.nodes()
+        node: Slot(_create_bound_call(graph, node, get_result))
+        for node in graph.nodes()
         if type(node) is Call
     }
-    output_slot = result_lookup[output_node] if output_node else None
+    output_slot = get_result(output_node) if output_node else None
     return bound_call_lookup, output_slot
 
 
+def _create_processor(
+    call: Call,
+    bound_call: Slot,
+    retry: Callable[[Callable], Callable],
+    progress_observer: ProgressObserver,
+) -> Callable[[], None]:
+    """Return a function that runs the call, with everything it needs resolved up front."""
+    scope = get_full_call_scope(call)
+    fn = call.fn
+    increment_running = progress_observer.increment_running
+    increment_completed = progress_observer.increment_completed
+    increment_failed = progress_observer.increment_failed
+
+    def processor():
+        increment_running(section="run", scope=scope)
+        try:
+            bound_call.value.run(fn, retry)
+        except Exception as exception:
+            # Drop internal frames
+            exception.__traceback__ = exception.__traceback__.tb_next.tb_next
+            increment_failed(
+                section="run",
+                scope=scope,
+                exception=create_chained_call_error(call, exception),
+            )
+            raise NodeError(call) from exception
+        finally:
+            bound_call.value = None
+        increment_completed(section="run", scope=scope)
+
+    return processor
+
+
 class PrepRunPhysical(NamedTuple):
     bound_call_lookup: dict[Node, BoundCall]
     output_slot: Slot
@@ -93,25 +139,15 @@ def prep_run_physical(
     retry = retry or identity
     progress_observer = progress_observer or NullProgressObserver()
 
+    processors = {
+        call: _create_processor(call, bound_call, retry, progress_observer)
+        for call, bound_call in bound_call_lookup.items()
+    }
+
     def process(node):
-        if type(node) is Call:
-            scope = get_full_call_scope(node)
-            progress_observer.increment_running(section="run", scope=scope)
-            bound_call = bound_call_lookup[node]
-            try:
-                bound_call.value.run(node.fn, retry)
-            except Exception as exception:
-                # Drop internal frames
-                exception.__traceback__ = exception.__traceback__.tb_next.tb_next
-                progress_observer.increment_failed(
-                    section="run",
-                    scope=scope,
-                    exception=create_chained_call_error(node, exception),
-                )
-                raise NodeError(node) from exception
-            finally:
-                bound_call.value = None
-            progress_observer.increment_completed(section="run", scope=scope)
+        processor = processors.get(node)
+        if processor is not None:
+            processor()
 
     return PrepRunPhysical(bound_call_lookup, output_slot, process, plan)
 
@@ -13,28 +13,152 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import itertools
 import random
-from collections import deque
-from functools import total_ordering
+import threading
 from heapq import heapify, heappop, heappush
-from queue import Queue
+from queue import Empty, SimpleQueue
 
 from uberjob._execution import greedy
 
+MAX_BATCH_SIZE = 64
 
-def create_simple_queue(initial_items):
-    queue = Queue()
-    queue.queue = deque(initial_items)
-    queue.unfinished_tasks = len(queue.queue)
-    return queue
 
+def get_batch_size(ready_count, worker_count, max_batch_size):
+    """Return how many ready items a worker should take at once while leaving plenty for the other workers."""
+    return max(1, min(max_batch_size, ready_count // (4 * worker_count)))
 
-class RandomQueue(Queue):
+
+class FifoQueue:
+    """
+    A first-in first-out work queue with the put/get/task_done/join protocol of :class:`queue.Queue`.
+
+    Items are passed through the C-implemented :class:`queue.SimpleQueue`; only the unfinished task count is
+    guarded by a Python lock.
+    """
+
+    def __init__(self, initial_items):
+        self._items = SimpleQueue()
+        self._unfinished_tasks = 0
+        for item in initial_items:
+            self._items.put(item)
+            self._unfinished_tasks += 1
+        self._all_tasks_done = threading.Condition(threading.Lock())
+
+    def put(self, item):
+        with self._all_tasks_done:
+            self._unfinished_tasks += 1
+        self._items.put(item)
+
+    def put_many(self, items):
+        with self._all_tasks_done:
+            self._unfinished_tasks += len(items)
+        for item in items:
+            self._items.put(item)
+
+    def get(self):
+        return self._items.get()
+
+    def empty(self):
+        return self._items.empty()
+
+    def get_batch(self, worker_count):
+        items = [self._items.get()]
+        batch_size = get_batch_size(
+            self._items.qsize() + 1, worker_count, MAX_BATCH_SIZE
+        )
+        try:
+            while len(items) < batch_size:
+                items.append(self._items.get_nowait())
+        except Empty:
+            pass
+        return items
+
+    def task_done(self, count=1):
+        with self._all_tasks_done:
+            unfinished_tasks = self._unfinished_tasks - count
+            if unfinished_tasks < 0:
+                raise ValueError("task_done() called too many times")
+            self._unfinished_tasks = unfinished_tasks
+            if not unfinished_tasks:
+                self._all_tasks_done.notify_all()
+
+    def join(self):
+        with self._all_tasks_done:
+            while self._unfinished_tasks:
+                self._all_tasks_done.wait()
+
+
+class WorkQueue:
+    """
+    A work queue with the put/get/task_done/join protocol of :class:`queue.Queue`, guarded by a single lock.
+
+    Unlike :class:`queue.Queue`, it is unbounded, so there is no ``not_full`` condition to maintain. Subclasses store
+    the items and implement ``_qsize``, ``_put``, and ``_get``, which are only called while holding the lock.
+    """
+
+    max_batch_size = MAX_BATCH_SIZE
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._all_tasks_done = threading.Condition(self._lock)
+        self._unfinished_tasks = 0
+
+    def put(self, item):
+        with self._lock:
+            self._put(item)
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+
+    def put_many(self, items):
+        with self._lock:
+            for item in items:
+                self._put(item)
+            self._unfinished_tasks += len(items)
+            self._not_empty.notify(len(items))
+
+    def get(self):
+        with self._lock:
+            while not self._qsize():
+                self._not_empty.wait()
+            return self._get()
+
+    def empty(self):
+        with self._lock:
+            return not self._qsize()
+
+    def get_batch(self, worker_count):
+        with self._lock:
+            while not self._qsize():
+                self._not_empty.wait()
+            batch_size = get_batch_size(
+                self._qsize(), worker_count, self.max_batch_size
+            )
+            return [self._get() for _ in range(batch_size)]
+
+    def task_done(self, count=1):
+        with self._lock:
+            unfinished_tasks = self._unfinished_tasks - count
+            if unfinished_tasks < 0:
+                raise ValueError("task_done() called too many times")
+            self._unfinished_tasks = unfinished_tasks
+            if not unfinished_tasks:
+                self._all_tasks_done.notify_all()
+
+    def join(self):
+        with self._lock:
+            while self._unfinished_tasks:
+                self._all_tasks_done.wait()
+
+
+class RandomQueue(WorkQueue):
     def __init__(self, initial_items):
         super().__init__()
+        self._random = random.Random()
         self.queue = list(initial_items)
-        random.shuffle(self.queue)
-        self.unfinished_tasks = len(self.queue)
+        self._random.shuffle(self.queue)
+        self._unfinished_tasks = len(self.queue)
 
     def _qsize(self):
         return len(self.queue)
@@ -42,50 +166,42 @@ class RandomQueue(Queue):
     def _put(self, item):
         # Online Fisher-Yates shuffle
         self.queue.append(item)
-        i = random.randrange(len(self.queue))
+        i = int(self._random.random() * len(self.queue))
         self.queue[i], self.queue[-1] = self.queue[-1], self.queue[i]
 
     def _get(self):
         return self.queue.pop()
 
 
-@total_ordering
-class KeyValuePair:
-    __slots__ = ("key", "value")
-
-    def __init__(self, key, value):
-        self.key = key
-        self.value = value
-
-    def __eq__(self, other):
-        return self.key == other.key
-
-    def __lt__(self, other):
-        return self.key < other.key
-
+class PriorityQueue(WorkQueue):
+    # Taking more than the single most important item would defeat the purpose of prioritizing.
+    max_batch_size = 1
 
-class PriorityQueue(Queue):
     def __init__(self, initial_items, priority):
         super().__init__()
-        self.queue = [KeyValuePair(priority(item), item) for item in initial_items]
+        # The counter breaks ties between equal priorities so that items are never compared.
+        self._counter = itertools.count()
+        self.queue = [
+            (priority(item), next(self._counter), item) for item in initial_items
+        ]
         heapify(self.queue)
-        self.unfinished_tasks = len(self.queue)
+        self._unfinished_tasks = len(self.queue)
         self.priority = priority
 
     def _qsize(self):
         return len(self.queue)
 
     def _put(self, item):
-        heappush(self.queue, KeyValuePair(self.priority(item), item))
+        heappush(self.queue, (self.priority(item), next(self._counter), item))
 
     def _get(self):
-        return heappop(self.queue).value
+        return heappop(self.queue)[2]
 
 
 def create_queue(graph, initial_items, scheduler):
     scheduler = scheduler or "default"
     if scheduler == "cheap":
-        return create_simple_queue(initial_items)
+        return FifoQueue(initial_items)
     if scheduler == "random":
         return RandomQueue(initial_items)
     if scheduler == "default":
@@ -13,12 +13,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from functools import lru_cache
+
 from uberjob._util import fully_qualified_name
 from uberjob.graph import Call
 
 
+@lru_cache(4096)
+def _get_full_call_scope(scope: tuple, fn) -> tuple:
+    return (*scope, fully_qualified_name(fn))
+
+
 def get_full_call_scope(call: Call) -> tuple:
-    return (*call.scope, fully_qualified_name(call.fn))
+    try:
+        # Calls sharing a scope and function share a single full scope tuple.
+        return _get_full_call_scope(call.scope, call.fn)
+    except TypeError:
+        # The scope or function is unhashable.
+        return (*call.scope, fully_qualified_name(call.fn))
 
 
 __all__ = ["get_full_call_scope"]
@@ -14,8 +14,8 @@
 # limitations under the License.
 #
 import operator
-from collections.abc import Callable, Generator
-from contextlib import contextmanager
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from threading import RLock
 
 from uberjob import _builtins
@@ -40,6 +40,38 @@ GATHER_LOOKUP = {
 }
 
 
+class _PlanScope:
+    """The context manager returned by :meth:`Plan.scope`; the scope lock is held until it exits."""
+
+    __slots__ = ("plan", "args", "parent_scope", "child_scope")
+
+    def __init__(self, plan, args):
+        self.plan = plan
+        self.args = args
+
+    def __enter__(self):
+        plan = self.plan
+        plan._scope_lock.acquire()
+        self.parent_scope = plan._scope
+        self.child_scope = self.parent_scope + self.args
+        plan._scope = self.child_scope
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        plan = self.plan
+        try:
+            if plan._scope != self.child_scope:
+                raise Exception(
+                    "Plan scopes must be entered and exited in stack order."
+                )
+            plan._scope = self.parent_scope
+        finally:
+            plan._scope_lock.release()
+
+
+def _iter_items(container):
+    return iter(container.items() if type(container) is dict else container)
+
+
 class Plan:
     """Represents a symbolic call graph."""
 
@@ -107,18 +139,28 @@ class Plan:
         self.graph.add_edge(source, target, Dependency())
 
     def _gather(self, stack_frame, value) -> Node:
-        def recurse(root):
-            root_type = type(root)
-            gather_fn = GATHER_LOOKUP.get(root_type)
-            if gather_fn is not None:
-                items = root.items() if root_type is dict else root
-                children = [recurse(item) for item in items]
+        get_gather_fn = GATHER_LOOKUP.get
+        gather_fn = get_gather_fn(type(value))
+        if gather_fn is None:
+            return value if isinstance(value, Node) else self.lit(value)
+        # Iterative post-order traversal. Each frame holds a container, its gather function, an iterator over its
+        # items, and its gathered children so far.
+        stack = [(value, gather_fn, _iter_items(value), [])]
+        while True:
+            root, gather_fn, items, children = stack[-1]
+            for item in items:
+                item_gather_fn = get_gather_fn(type(item))
+                if item_gather_fn is not None:
+                    stack.append((item, item_gather_fn, _iter_items(item), []))
+                    break
+                children.append(item)
+            else:
+                stack.pop()
                 if any(isinstance(child, Node) for child in children):
-                    return self._call(stack_frame, gather_fn, *children)
-            return root
-
-        value = recurse(value)
-        return value if isinstance(value, Node) else self.lit(value)
+                    root = self._call(stack_frame, gather_fn, *children)
+                if not stack:
+                    return root if isinstance(root, Node) else self.lit(root)
+                stack[-1][3].append(root)
 
     def gather(self, value) -> Node:
         """
@@ -152,25 +194,13 @@ class Plan:
             for index in range(length)
         )
 
-    @contextmanager
-    def scope(self, *args) -> Generator[None, None, None]:
+    def scope(self, *args) -> AbstractContextManager[None]:
         """
         A context manager for organizing a :class:`~uberjob.Plan`.
 
         :param args: Values to append to the end of the current scope; they must be hashable and equatable.
         """
-        with self._scope_lock:
-            parent_scope = self._scope
-            child_scope = parent_scope + args
-            self._scope = child_scope
-            try:
-                yield
-            finally:
-                if self._scope != child_scope:
-                    raise Exception(
-                        "Plan scopes must be entered and exited in stack order."
-                    )
-                self._scope = parent_scope
+        return _PlanScope(self, args)
 
     def copy(self) -> "Plan":
         """
@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import copy
+import os
 from collections.abc import Iterable, KeysView
 
 from uberjob._builtins import source
@@ -22,15 +22,40 @@ from uberjob._util import validation
 from uberjob._util.traceback import get_stack_frame
 from uberjob._value_store import ValueStore
 
+# Setting UBERJOB_CAPTURE_STACK_FRAMES=0 skips capturing where value stores were registered, which speeds up
+# registering many value stores at the cost of symbolic tracebacks for their reads and writes.
+# The flag is read on every registration, so it can also be changed at runtime.
+CAPTURE_STACK_FRAMES = os.environ.get("UBERJOB_CAPTURE_STACK_FRAMES", "1") != "0"
+
+
+def _get_caller_stack_frame():
+    return get_stack_frame(initial_depth=3) if CAPTURE_STACK_FRAMES else None
+
 
 class RegistryValue:
-    __slots__ = ("value_store", "is_source", "stack_frame")
+    __slots__ = ("value_store", "stack_frame")
 
-    def __init__(self, value_store, *, is_source, stack_frame):
+    is_source = False
+
+    def __init__(self, value_store, *, stack_frame):
         self.value_store = value_store
-        self.is_source = is_source
         self.stack_frame = stack_frame
 
+    def __copy__(self):
+        cls = type(self)
+        new_value = cls.__new__(cls)
+        new_value.value_store = self.value_store
+        new_value.stack_frame = self.stack_frame
+        return new_value
+
+
+class SourceRegistryValue(RegistryValue):
+    """The registry value of a node created by :meth:`Registry.source`."""
+
+    __slots__ = ()
+
+    is_source = True
+
 
 class Registry:
     """A mapping from :class:`~uberjob.graph.Node` to :class:`~uberjob.ValueStore`."""
@@ -45,12 +70,13 @@ class Registry:
         :param node: The plan node.
         :param value_store: The value store for the node.
         """
-        validation.assert_is_instance(node, "node", Node)
-        validation.assert_is_instance(value_store, "value_store", ValueStore)
+        if __debug__:
+            validation.assert_is_instance(node, "node", Node)
+            validation.assert_is_instance(value_store, "value_store", ValueStore)
         if node in self.mapping:
             raise Exception("The node already has a value store.")
         self.mapping[node] = RegistryValue(
-            value_store, is_source=False, stack_frame=get_stack_frame()
+            value_store, stack_frame=_get_caller_stack_frame()
         )
 
     def source(self, plan: Plan, value_store: ValueStore) -> Node:
@@ -62,13 +88,12 @@ class Registry:
         :param value_store: The value store to read from.
         :return: The newly added plan node.
         """
-        validation.assert_is_instance(plan, "plan", Plan)
-        validation.assert_is_instance(value_store, "value_store", ValueStore)
-        stack_frame = get_stack_frame()
+        if __debug__:
+            validation.assert_is_instance(plan, "plan", Plan)
+            validation.assert_is_instance(value_store, "value_store", ValueStore)
+        stack_frame = _get_caller_stack_frame()
         node = plan._call(stack_frame, source)
-        self.mapping[node] = RegistryValue(
-            value_store, is_source=True, stack_frame=stack_frame
-        )
+        self.mapping[node] = SourceRegistryValue(value_store, stack_frame=stack_frame)
         return node
 
     def __contains__(self, node: Node) -> bool:
@@ -147,7 +172,7 @@ class Registry:
         """
         new_registry = Registry()
         new_registry.mapping = {
-            node: copy.copy(registry_value)
+            node: registry_value.__copy__()
             for node, registry_value in self.mapping.items()
         }
         return new_registry
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import itertools
 from collections.abc import Callable
 
 from uberjob._plan import Plan
@@ -34,76 +35,74 @@ PURPLE = (187 / 255, 47 / 255, 237 / 255)
 GRAY = (0.4, 0.4, 0.4)
 
 
+class Scope:
+    pass
+
+
+NODE_FILLCOLORS = {Literal: TEAL, Call: ORANGE, Scope: GRAY}
+
+
+def get_literal_label(value, literal_labels: dict) -> str:
+    # Keyed by id, since literal values need not be hashable; the value is kept to guard against id reuse.
+    entry = literal_labels.get(id(value))
+    if entry is None or entry[0] is not value:
+        entry = value, compact_repr(value)
+        literal_labels[id(value)] = entry
+    return entry[1]
+
+
+def get_node_label(u, d, node_type, literal_labels: dict) -> str | None:
+    if node_type is Literal:
+        return get_literal_label(u.value, literal_labels)
+    if node_type is Call:
+        return fully_qualified_name(u.fn)
+    if node_type is Scope:
+        count = d["count"]
+        return "\n".join(
+            [
+                *(str(value) for value in d["scope"]),
+                "{} {}".format(count, "node" if count == 1 else "nodes"),
+            ]
+        )
+    return None
+
+
+def get_node_style(u, d, registry: Registry, literal_labels: dict) -> dict:
+    # The node type is looked up once to pick both the fill color and the label.
+    node_type = type(u)
+    label = get_node_label(u, d, node_type, literal_labels)
+    if u in registry:
+        fillcolor = PURPLE
+        if label is not None:
+            label = "\n".join([label, repr(registry[u])])
+    else:
+        fillcolor = NODE_FILLCOLORS.get(node_type)
+    style = {
+        "shape": "box",
+        "style": "filled",
+        "margin": 0.05,
+        "width": 0,
+        "height": 0,
+        "fontcolor": "white",
+    }
+    # Other node types get no fill color or label, as with the default Graphviz style.
+    if fillcolor is not None:
+        style["fillcolor"] = fillcolor
+    if label is not None:
+        style["label"] = label
+    return style
+
+
 def default_style(registry: Registry | None = None):
     import nxv
 
     if registry is None:
         registry = Registry()
 
+    literal_labels = {}
+
     style = nxv.Style(
-        node=nxv.chain(
-            [
-                {
-                    "shape": "box",
-                    "style": "filled",
-                    "margin": 0.05,
-                    "width": 0,
-                    "height": 0,
-                    "fontcolor": "white",
-                },
-                nxv.switch(
-                    lambda u, d: type(u),
-                    {
-                        Literal: {"fillcolor": TEAL},
-                        Call: {"fillcolor": ORANGE},
-                        Scope: {"fillcolor": GRAY},
-                    },
-                ),
-                nxv.switch(
-                    lambda u, d: u in registry, {True: {"fillcolor": PURPLE}, False: {}}
-                ),
-                nxv.switch(
-                    lambda u, d: u in registry,
-                    {
-                        False: nxv.switch(
-                            lambda u, d: type(u),
-                            {
-                                Literal: lambda u, d: {"label": compact_repr(u.value)},
-                                Call: lambda u, d: {
-                                    "label": fully_qualified_name(u.fn)
-                                },
-                                Scope: lambda u, d: {
-                                    "label": "\n".join(
-                                        [
-                                            *(str(value) for value in d["scope"]),
-                                            "{} {}".format(
-                                                d["count"],
-                                                "node" if d["count"] == 1 else "nodes",
-                                            ),
-                                        ]
-                                    )
-                                },
-                            },
-                        ),
-                        True: nxv.switch(
-                            lambda u, d: type(u),
-                            {
-                                Literal: lambda u, d: {
-                                    "label": "\n".join(
-                                        [compact_repr(u.value), repr(registry[u])]
-                                    )
-                                },
-                                Call: lambda u, d: {
-                                    "label": "\n".join(
-                                        [fully_qualified_name(u.fn), repr(registry[u])]
-                                    )
-                                },
-                            },
-                        ),
-                    },
-                ),
-            ]
-        ),
+        node=lambda u, d: get_node_style(u, d, registry, literal_labels),
         edge=nxv.chain(
             [
                 {"arrowhead": "open", "arrowtail": "open"},
@@ -124,10 +123,6 @@ def default_style(registry: Registry | None = None):
     return style
 
 
-class Scope:
-    pass
-
-
 def render(
     plan: Plan | Graph | tuple[Plan, Node | None],
     *,
@@ -157,7 +152,10 @@ def render(
     ):
         plan = plan[0]
     validation.assert_is_instance(plan, "plan", (Plan, Graph))
-    graph = (plan.graph if isinstance(plan, Plan) else plan).copy()
+    graph = plan.graph if isinstance(plan, Plan) else plan
+    if predicate or level is not None:
+        # Only copy the graph when it is about to be modified.
+        graph = graph.copy()
     if predicate:
         graph.remove_nodes_from(
             [u for u, d in graph.nodes(data=True) if not predicate(u, d)]
@@ -171,23 +169,26 @@ def render(
                 scope_groups.setdefault(scope[:level], []).append(u)
         for scope, group in scope_groups.items():
             group = set(group)
-            predecessors = set()
-            successors = set()
-            for w in group:
-                predecessors.update(graph.predecessors(w))
-                successors.update((v, e) for _, v, e in graph.out_edges(w, keys=True))
+            predecessors = {u for u, _ in graph.in_edges(group) if u not in group}
+            successors = {
+                (v, e)
+                for _, v, e in graph.out_edges(group, keys=True)
+                if v not in group
+            }
             scope_node = Scope()
             graph.add_node(scope_node, scope=scope, count=len(group))
             graph.remove_nodes_from(group)
             graph.add_edges_from(
-                (predecessor, scope_node, Dependency())
-                for predecessor in predecessors
-                if predecessor not in group
-            )
-            graph.add_edges_from(
-                (scope_node, successor, dependency)
-                for successor, dependency in successors
-                if successor not in group
+                itertools.chain(
+                    (
+                        (predecessor, scope_node, Dependency())
+                        for predecessor in predecessors
+                    ),
+                    (
+                        (scope_node, successor, dependency)
+                        for successor, dependency in successors
+                    ),
+                )
             )
 
     style = default_style(registry)
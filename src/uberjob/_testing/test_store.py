@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 import datetime as dt
+import itertools
 
 from uberjob._util import Missing, repr_helper
 from uberjob._value_store import ValueStore
@@ -30,8 +31,13 @@ class TestStore(ValueStore):
     :param can_write: Determines whether the value store is allowed to write. Defaults to True.
     :param read_count: The number of times read has been called. Defaults to 0.
     :param write_count: The number of times write has been called. Defaults to 0.
+    :param use_fake_clock: Determines whether writes take their modified time from a shared, strictly increasing fake
+                           clock instead of the current time. Defaults to False.
     """
 
+    _FAKE_CLOCK_START = dt.datetime(2000, 1, 1)
+    _fake_clock = itertools.count(1)
+
     def __init__(
         self,
         value=Missing,
@@ -41,7 +47,8 @@ class TestStore(ValueStore):
         can_write=True,
         can_get_modified_time=True,
         read_count=0,
-        write_count=0
+        write_count=0,
+        use_fake_clock=False
     ):
         if modified_time is not Missing and (value is Missing) != (
             modified_time is None
@@ -62,6 +69,7 @@ class TestStore(ValueStore):
         self.can_get_modified_time = can_get_modified_time
         self.read_count = read_count
         self.write_count = write_count
+        self.use_fake_clock = use_fake_clock
 
     def read(self):
         if not self.can_read:
@@ -76,7 +84,11 @@ class TestStore(ValueStore):
             raise Exception("This test store cannot write.")
         self.write_count += 1
         self.value = value
-        self.modified_time = dt.datetime.utcnow()
+        self.modified_time = (
+            self._FAKE_CLOCK_START + dt.timedelta(microseconds=next(self._fake_clock))
+            if self.use_fake_clock
+            else dt.datetime.utcnow()
+        )
 
     def get_modified_time(self) -> dt.datetime | None:
         if not self.can_get_modified_time:
@@ -100,6 +112,7 @@ class TestStore(ValueStore):
             can_write=self.can_write,
             read_count=self.read_count,
             write_count=self.write_count,
+            use_fake_clock=self.use_fake_clock,
             defaults={
                 0: Missing,
                 "modified_time": None,
@@ -107,5 +120,6 @@ class TestStore(ValueStore):
                 "can_write": True,
                 "read_count": 0,
                 "write_count": 0,
+                "use_fake_clock": False,
             },
         )
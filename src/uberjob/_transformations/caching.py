@@ -23,8 +23,8 @@ from uberjob._plan import Plan
 from uberjob._registry import Registry, RegistryValue
 from uberjob._transformations import get_mutable_plan
 from uberjob._transformations.pruning import prune_plan, prune_source_literals
-from uberjob._util import Slot, fully_qualified_name, safe_max
-from uberjob.graph import Call, Dependency, KeywordArg, Node, PositionalArg
+from uberjob._util import fully_qualified_name, safe_max
+from uberjob.graph import Call, Dependency, KeywordArg, Literal, Node, PositionalArg
 from uberjob.progress._progress_observer import ProgressObserver
 
 
@@ -46,17 +46,26 @@ def _to_naive_utc_time(value: dt.datetime | None) -> dt.datetime | None:
     )
 
 
-def _get_stale_scope(call: Call, registry: Registry) -> tuple:
+def _get_stale_scope(
+    call: Call, registry: Registry, value_store_names: dict[type, str]
+) -> tuple:
     scope = get_full_call_scope(call)
     value_store = registry.get(call)
     if value_store is None:
         return scope
-    return (*scope, fully_qualified_name(value_store.__class__))
+    value_store_class = value_store.__class__
+    # There are usually only a few value store classes, so their names are looked up once each.
+    value_store_name = value_store_names.get(value_store_class)
+    if value_store_name is None:
+        value_store_name = fully_qualified_name(value_store_class)
+        value_store_names[value_store_class] = value_store_name
+    return (*scope, value_store_name)
 
 
 def _get_stale_nodes(
     plan: Plan,
     registry: Registry,
+    stale_scope_lookup: dict[Call, tuple],
     *,
     retry,
     max_workers: int | None = None,
@@ -67,44 +76,49 @@ def _get_stale_nodes(
         plan, inplace=False, predicate=lambda node: node not in registry
     )
     fresh_time = _to_naive_utc_time(fresh_time)
-    stale_lookup = {node: Slot(False) for node in plan.graph.nodes()}
-    modified_time_lookup = {node: Slot() for node in plan.graph.nodes()}
-
-    def process_no_stale_ancestor(node):
-        max_ancestor_modified_time = safe_max(
-            modified_time_lookup[predecessor].value
-            for predecessor in plan.graph.predecessors(node)
+    stale_lookup = dict.fromkeys(plan.graph.nodes(), False)
+    modified_time_lookup = dict.fromkeys(plan.graph.nodes())
+    registry_mapping = registry.mapping
+    # Each node's predecessors are walked twice, so they are collected once up front.
+    pred = plan.graph.pred
+    predecessor_lookup = {node: tuple(pred[node]) for node in plan.graph.nodes()}
+
+    def process_no_stale_ancestor(node, predecessors):
+        max_ancestor_modified_time = (
+            safe_max(modified_time_lookup[predecessor] for predecessor in predecessors)
+            if predecessors
+            else None
         )
-        value_store = registry.get(node)
-        if value_store is None:
-            modified_time_lookup[node].value = max_ancestor_modified_time
+        registry_value = registry_mapping.get(node)
+        if registry_value is None:
+            modified_time_lookup[node] = max_ancestor_modified_time
             return
-        modified_time = _to_naive_utc_time(retry(value_store.get_modified_time)())
+        modified_time = _to_naive_utc_time(
+            retry(registry_value.value_store.get_modified_time)()
+        )
         if modified_time is None:
-            stale_lookup[node].value = True
+            stale_lookup[node] = True
             return
-        if (
-            max_ancestor_modified_time or not registry.mapping[node].is_source
-        ) and safe_max(
+        if (max_ancestor_modified_time or not registry_value.is_source) and safe_max(
             modified_time, max_ancestor_modified_time, fresh_time
         ) > modified_time:
-            stale_lookup[node].value = True
+            stale_lookup[node] = True
             return
-        modified_time_lookup[node].value = modified_time
+        modified_time_lookup[node] = modified_time
 
     def process(node):
-        has_stale_ancestor = any(
-            stale_lookup[predecessor].value
-            for predecessor in plan.graph.predecessors(node)
-        )
-        if has_stale_ancestor:
-            stale_lookup[node].value = True
+        predecessors = predecessor_lookup[node]
+        # Source nodes skip both predecessor scans.
+        if predecessors and any(
+            stale_lookup[predecessor] for predecessor in predecessors
+        ):
+            stale_lookup[node] = True
         else:
-            process_no_stale_ancestor(node)
+            process_no_stale_ancestor(node, predecessors)
 
     def process_with_callbacks(node):
-        if type(node) is Call:
-            scope = _get_stale_scope(node, registry)
+        scope = stale_scope_lookup.get(node)
+        if scope is not None:
             progress_observer.increment_running(section="stale", scope=scope)
             try:
                 process(node)
@@ -126,11 +140,16 @@ def _get_stale_nodes(
     run_function_on_graph(
         plan.graph, process_with_callbacks, worker_count=max_workers, scheduler="cheap"
     )
-    return {k for k, v in stale_lookup.items() if v.value}
+    return {k for k, v in stale_lookup.items() if v}
 
 
 def _add_value_store(
-    plan: Plan, node: Node, registry_value: RegistryValue, *, is_stale: bool
+    plan: Plan,
+    node: Node,
+    registry_value: RegistryValue,
+    value_store_literals: dict[tuple[int, tuple], Literal],
+    *,
+    is_stale: bool,
 ) -> tuple[Node | None, Node]:
     def nested_call(*args):
         call = plan._call(registry_value.stack_frame, *args)
@@ -138,11 +157,19 @@ def _add_value_store(
             call.scope = get_full_call_scope(node)
         return call
 
-    out_edges = list(plan.graph.out_edges(node, keys=True))
+    out_edges = [
+        (successor, dependency)
+        for _, successor, dependency in plan.graph.out_edges(node, keys=True)
+    ]
     value_store = registry_value.value_store
 
     with plan.scope(*node.scope):
-        value_store_lit = plan.lit(value_store)
+        # A value store registered for several nodes in the same scope gets a single literal.
+        value_store_key = id(value_store), node.scope
+        value_store_lit = value_store_literals.get(value_store_key)
+        if value_store_lit is None:
+            value_store_lit = plan.lit(value_store)
+            value_store_literals[value_store_key] = value_store_lit
         write_node = None
         read_node = nested_call(value_store.__class__.read, value_store_lit)
         if is_stale:
@@ -156,7 +183,7 @@ def _add_value_store(
                 )
             plan.graph.add_edge(write_node, read_node, Dependency())
 
-    for _, successor, dependency in out_edges:
+    for successor, dependency in out_edges:
         plan.graph.remove_edge(node, successor, dependency)
         dependency_type = type(dependency)
         if dependency_type in (PositionalArg, KeywordArg):
@@ -169,13 +196,9 @@ def _add_value_store(
 
 
 def _update_stale_totals(
-    plan: Plan, registry: Registry, progress_observer: ProgressObserver
+    stale_scope_lookup: dict[Call, tuple], progress_observer: ProgressObserver
 ) -> None:
-    scope_counts = collections.Counter(
-        _get_stale_scope(node, registry)
-        for node in plan.graph.nodes()
-        if type(node) is Call
-    )
+    scope_counts = collections.Counter(stale_scope_lookup.values())
     for scope, count in scope_counts.items():
         progress_observer.increment_total(section="stale", scope=scope, amount=count)
 
@@ -191,11 +214,18 @@ def plan_with_value_stores(
     inplace: bool,
     progress_observer,
 ) -> tuple[Plan, Node | None]:
-    _update_stale_totals(plan, registry, progress_observer)
+    value_store_names = {}
+    stale_scope_lookup = {
+        node: _get_stale_scope(node, registry, value_store_names)
+        for node in plan.graph.nodes()
+        if type(node) is Call
+    }
+    _update_stale_totals(stale_scope_lookup, progress_observer)
     plan = get_mutable_plan(plan, inplace=inplace)
     stale_nodes = _get_stale_nodes(
         plan,
         registry,
+        stale_scope_lookup,
         max_workers=max_workers,
         retry=retry,
         fresh_time=fresh_time,
@@ -203,10 +233,11 @@ def plan_with_value_stores(
     )
     read_node_lookup = {}
     required_nodes = set()
+    value_store_literals = {}
     for node, registry_value in registry.mapping.items():
         is_stale = node in stale_nodes
         write_node, read_node = _add_value_store(
-            plan, node, registry_value, is_stale=is_stale
+            plan, node, registry_value, value_store_literals, is_stale=is_stale
         )
         if write_node:
             required_nodes.add(write_node)
@@ -18,7 +18,7 @@ from collections.abc import Callable, Iterable
 
 from uberjob._plan import Plan
 from uberjob._transformations import get_mutable_plan
-from uberjob._util.networkx_util import all_ancestors, is_source_node
+from uberjob._util.networkx_util import all_ancestors, induced_subgraph, is_source_node
 from uberjob.graph import Dependency, Literal, Node
 
 
@@ -34,8 +34,12 @@ def prune_plan(
         required_nodes.add(output_node)
     plan = get_mutable_plan(plan, inplace=inplace)
     required_nodes = all_ancestors(plan.graph, required_nodes)
-    prune_nodes = set(plan.graph.nodes()) - required_nodes
-    plan.graph.remove_nodes_from(prune_nodes)
+    graph = plan.graph
+    if 2 * len(required_nodes) < len(graph):
+        # Copying the few required nodes is cheaper than removing the many others one edge at a time.
+        plan.graph = induced_subgraph(graph, required_nodes)
+    else:
+        graph.remove_nodes_from([node for node in graph if node not in required_nodes])
 
     for literal in [
         u for u in plan.graph.nodes() if type(u) is Literal and u != output_node
@@ -66,8 +70,10 @@ def _prune_literal_if_trivial(plan: Plan, literal: Literal) -> None:
     if m * n > m + n:
         return
 
-    for predecessor, successor in itertools.product(predecessors, successors):
-        plan.graph.add_edge(predecessor, successor, Dependency())
+    plan.graph.add_edges_from(
+        (predecessor, successor, Dependency())
+        for predecessor, successor in itertools.product(predecessors, successors)
+    )
     plan.graph.remove_node(literal)
 
 
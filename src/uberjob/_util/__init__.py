@@ -19,7 +19,11 @@ from reprlib import Repr
 
 def safe_max(*args):
     iterable = args[0] if len(args) == 1 else args
-    return max((value for value in iterable if value is not None), default=None)
+    result = None
+    for value in iterable:
+        if value is not None and (result is None or value > result):
+            result = value
+    return result
 
 
 def is_ipython():
@@ -87,8 +91,15 @@ def repr_helper(instance, *args, defaults=None, **kwargs):
     )
 
 
-@lru_cache(4096)
 def fully_qualified_name(x):
+    try:
+        return _cached_fully_qualified_name(x)
+    except TypeError:
+        # x is unhashable, such as a callable instance that defines __eq__ without __hash__.
+        return _fully_qualified_name(x)
+
+
+def _fully_qualified_name(x):
     qualname = getattr(x, "__qualname__", None)
     if not qualname:
         if callable(x):
@@ -103,3 +114,6 @@ def fully_qualified_name(x):
     ):
         return qualname
     return f"{module}.{qualname}"
+
+
+_cached_fully_qualified_name = lru_cache(4096)(_fully_qualified_name)
@@ -23,6 +23,7 @@ def assert_acyclic(graph):
 
 def all_ancestors(graph, sources):
     """Returns all nodes having a path to any of the given sources."""
+    pred = graph.pred
     visited = set()
     frontier = list(sources)
     while frontier:
@@ -30,10 +31,33 @@ def all_ancestors(graph, sources):
         if node in visited:
             continue
         visited.add(node)
-        frontier.extend(graph.predecessors(node))
+        # Skipping visited predecessors here keeps high fan-in nodes from being pushed once per successor.
+        frontier.extend(p for p in pred[node] if p not in visited)
     return visited
 
 
+def induced_subgraph(graph, nodes):
+    """
+    Returns a new graph containing the given nodes and the edges between them.
+
+    Unlike ``graph.subgraph(nodes).copy()``, the node and edge order of the original graph is kept.
+    """
+    subgraph = graph.__class__()
+    subgraph.graph.update(graph.graph)
+    subgraph.add_nodes_from(
+        (node, data) for node, data in graph.nodes(data=True) if node in nodes
+    )
+    subgraph.add_edges_from(
+        (u, v, key, data)
+        for u, neighbors in graph.adj.items()
+        if u in nodes
+        for v, key_data in neighbors.items()
+        if v in nodes
+        for key, data in key_data.items()
+    )
+    return subgraph
+
+
 def predecessor_count(graph, node) -> int:
     return len(graph.pred[node])
 
@@ -61,13 +85,18 @@ def topological_sort(graph):
         else:
             q.append(node)
 
+    yielded_count = 0
     while q:
         node = q.pop()
         for successor in succ[node]:
-            pred_count_mapping[successor] -= 1
-            if pred_count_mapping[successor] == 0:
+            pred_count = pred_count_mapping[successor] - 1
+            if pred_count:
+                pred_count_mapping[successor] = pred_count
+            else:
+                del pred_count_mapping[successor]
                 q.append(successor)
+        yielded_count += 1
         yield node
 
-    if any(pred_count_mapping.values()):
+    if yielded_count != len(graph):
         raise nx.HasACycle("The graph contains a cycle.")
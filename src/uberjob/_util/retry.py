@@ -33,13 +33,13 @@ def create_retry(attempts, exc_type=Exception):
     def inner_retry(f):
         @wraps(f)
         def wrapper(*args, **kwargs):
-            for attempt_index in range(attempts):
+            for _ in range(attempts - 1):
                 try:
                     return f(*args, **kwargs)
                 except exc_type:
-                    is_last_attempt = attempt_index == attempts - 1
-                    if is_last_attempt:
-                        raise
+                    pass
+            # The last attempt is unguarded, so its exception propagates.
+            return f(*args, **kwargs)
 
         return wrapper
 
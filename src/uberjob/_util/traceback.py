@@ -15,9 +15,12 @@
 #
 """Provides symbolic traceback functionality."""
 import inspect
+from functools import lru_cache
 
 from uberjob._util import Omitted, repr_helper
 
+_STACK_FRAME_DEFAULTS = {"outer": None}
+
 
 class StackFrame:
     """
@@ -44,7 +47,7 @@ class StackFrame:
             path=self.path,
             line=self.line,
             outer=Omitted if self.outer else None,
-            defaults={"outer": None},
+            defaults=_STACK_FRAME_DEFAULTS,
         )
 
 
@@ -52,6 +55,8 @@ TruncatedStackFrame = None
 
 
 class TruncatedStackFrameType:
+    __slots__ = ()
+
     def __repr__(self):
         return "TruncatedStackFrame"
 
@@ -67,23 +72,27 @@ TruncatedStackFrame = TruncatedStackFrameType()
 MAX_TRACEBACK_DEPTH = 3
 
 
-def get_stack_frame(initial_depth=2):
-    def recurse(frame, depth):
-        if not frame:
-            return None
-        if depth < 0:
-            return TruncatedStackFrame
-        return StackFrame(
-            name=frame.f_code.co_name,
-            path=frame.f_code.co_filename,
-            line=frame.f_lineno,
-            outer=recurse(frame.f_back, depth - 1),
-        )
+@lru_cache(4096)
+def _intern_stack_frame(name, path, line, outer):
+    # Plans are often built in loops, so many nodes share a stack; outer frames are interned too, so the
+    # identity-hashed outer frame is part of the key.
+    return StackFrame(name=name, path=path, line=line, outer=outer)
+
 
-    initial_frame = inspect.currentframe()
+def get_stack_frame(initial_depth=2):
+    frame = inspect.currentframe()
     for _ in range(initial_depth):
-        initial_frame = initial_frame.f_back
-    return recurse(initial_frame, MAX_TRACEBACK_DEPTH)
+        frame = frame.f_back
+    frames = []
+    while frame and len(frames) <= MAX_TRACEBACK_DEPTH:
+        frames.append(frame)
+        frame = frame.f_back
+    stack_frame = TruncatedStackFrame if frame else None
+    for frame in reversed(frames):
+        stack_frame = _intern_stack_frame(
+            frame.f_code.co_name, frame.f_code.co_filename, frame.f_lineno, stack_frame
+        )
+    return stack_frame
 
 
 def render_symbolic_traceback(stack_frame):
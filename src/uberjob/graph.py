@@ -85,6 +85,16 @@ class Dependency:
 
     __slots__ = ()
 
+    _instance = None
+
+    def __new__(cls):
+        # Plain dependencies are all equal, so they share a single instance.
+        if cls is not Dependency:
+            return super().__new__(cls)
+        if Dependency._instance is None:
+            Dependency._instance = super().__new__(cls)
+        return Dependency._instance
+
     def __repr__(self):
         return repr_helper(self)
 
@@ -105,12 +115,19 @@ class PositionalArg(Dependency):
 
     __slots__ = ("index",)
 
+    def __new__(cls, index: int):
+        # Unlike plain dependencies, argument dependencies are not shared.
+        return object.__new__(cls)
+
     def __init__(self, index: int):
         self.index = index
 
     def __repr__(self):
         return repr_helper(self, self.index)
 
+    def __reduce__(self):
+        return PositionalArg, (self.index,)
+
     def __hash__(self):
         return hash(self.index)
 
@@ -127,17 +144,25 @@ class KeywordArg(Dependency):
     :param index: The index of the argument; required because keyword arguments are ordered in Python 3.6+.
     """
 
-    __slots__ = ("name", "index")
+    __slots__ = ("name", "index", "_hash")
+
+    def __new__(cls, name: str, index: int):
+        return object.__new__(cls)
 
     def __init__(self, name: str, index: int):
         self.name = name
         self.index = index
+        self._hash = hash((name, index))
 
     def __repr__(self):
         return repr_helper(self, self.name, self.index)
 
+    def __reduce__(self):
+        # String hashes differ between processes, so the cached hash must not be pickled.
+        return KeywordArg, (self.name, self.index)
+
     def __hash__(self):
-        return hash((self.name, self.index))
+        return self._hash
 
     def __eq__(self, other):
         return (
@@ -154,23 +179,28 @@ def get_argument_nodes(graph: Graph, call: Call) -> tuple[list[Node], dict[str,
     :param graph: The graph.
     :param call: The call.
     """
-    in_edges = graph.in_edges(call, keys=True)
-
-    args = []
-    keyword_arg_pairs = []
-    for _, _, edge_key in in_edges:
-        if type(edge_key) is PositionalArg:
-            args.append(None)
-        elif type(edge_key) is KeywordArg:
-            keyword_arg_pairs.append(None)
-
-    for predecessor, _, edge_key in in_edges:
-        if type(edge_key) is PositionalArg:
-            args[edge_key.index] = predecessor
-        elif type(edge_key) is KeywordArg:
-            keyword_arg_pairs[edge_key.index] = edge_key.name, predecessor
-
-    return args, dict(keyword_arg_pairs)
+    positional_edges = []
+    keyword_edges = []
+    # The adjacency dict is read directly to avoid building an in-edge view for every call.
+    for predecessor, edge_keys in graph.pred[call].items():
+        for edge_key in edge_keys:
+            edge_key_type = type(edge_key)
+            if edge_key_type is PositionalArg:
+                positional_edges.append((edge_key.index, predecessor))
+            elif edge_key_type is KeywordArg:
+                keyword_edges.append((edge_key.index, edge_key.name, predecessor))
+
+    # The indexes of each kind of argument are 0 through n - 1.
+    args = [None] * len(positional_edges)
+    for index, predecessor in positional_edges:
+        args[index] = predecessor
+    keyword_names = [None] * len(keyword_edges)
+    keyword_values = [None] * len(keyword_edges)
+    for index, name, predecessor in keyword_edges:
+        keyword_names[index] = name
+        keyword_values[index] = predecessor
+
+    return args, dict(zip(keyword_names, keyword_values))
 
 
 def get_scope(graph: Graph, node: Node) -> tuple:
@@ -81,6 +81,9 @@ def composite_progress(*members: Progress) -> Progress:
 
     :param members: The members.
     """
+    if len(members) == 1:
+        # There is nothing to forward to but the single member.
+        return members[0]
 
     def create_observer():
         return CompositeProgressObserver(progress.observer() for progress in members)
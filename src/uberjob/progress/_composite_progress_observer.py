@@ -28,6 +28,19 @@ class CompositeProgressObserver(ProgressObserver):
                 raise TypeError(
                     f"Expected a ProgressObserver, but got a {type(progress_observer)!r} instead."
                 )
+        # The methods are bound once, since they are called for every node.
+        self._increment_total_methods = tuple(
+            o.increment_total for o in self._progress_observers
+        )
+        self._increment_running_methods = tuple(
+            o.increment_running for o in self._progress_observers
+        )
+        self._increment_completed_methods = tuple(
+            o.increment_completed for o in self._progress_observers
+        )
+        self._increment_failed_methods = tuple(
+            o.increment_failed for o in self._progress_observers
+        )
         self._stack = None
 
     def __enter__(self):
@@ -40,21 +53,17 @@ class CompositeProgressObserver(ProgressObserver):
         self._stack.__exit__(exc_type, exc_val, exc_tb)
 
     def increment_total(self, *, section: str, scope: tuple, amount: int):
-        for progress_observer in self._progress_observers:
-            progress_observer.increment_total(
-                section=section, scope=scope, amount=amount
-            )
+        for increment_total in self._increment_total_methods:
+            increment_total(section=section, scope=scope, amount=amount)
 
     def increment_running(self, *, section: str, scope: tuple):
-        for progress_observer in self._progress_observers:
-            progress_observer.increment_running(section=section, scope=scope)
+        for increment_running in self._increment_running_methods:
+            increment_running(section=section, scope=scope)
 
     def increment_completed(self, *, section: str, scope: tuple):
-        for progress_observer in self._progress_observers:
-            progress_observer.increment_completed(section=section, scope=scope)
+        for increment_completed in self._increment_completed_methods:
+            increment_completed(section=section, scope=scope)
 
     def increment_failed(self, *, section: str, scope: tuple, exception: Exception):
-        for progress_observer in self._progress_observers:
-            progress_observer.increment_failed(
-                section=section, scope=scope, exception=exception
-            )
+        for increment_failed in self._increment_failed_methods:
+            increment_failed(section=section, scope=scope, exception=exception)
@@ -16,8 +16,6 @@
 import datetime as dt
 import textwrap
 import traceback
-from functools import partial
-from io import StringIO
 
 from uberjob.progress._simple_progress_observer import (
     SimpleProgressObserver,
@@ -89,24 +87,25 @@ class ConsoleProgressObserver(SimpleProgressObserver):
         self._skipped_sections = set()
 
     def _render(self, state, new_exception_index, exception_tuples, elapsed):
-        with StringIO() as buffer:
-            print_ = partial(print, file=buffer)
-            _print_header(print_, elapsed)
-            for section in ("stale", "run"):
-                scope_mapping = state.get(section)
-                if scope_mapping:
-                    is_done = all(
-                        s.completed + s.failed == s.total
-                        for s in scope_mapping.values()
-                    )
-                    if not is_done or section not in self._skipped_sections:
-                        _print_section(print_, section, scope_mapping)
-                    if is_done:
-                        self._skipped_sections.add(section)
-                    else:
-                        self._skipped_sections.discard(section)
-            _print_new_exceptions(print_, new_exception_index, exception_tuples)
-            return buffer.getvalue()
+        lines = []
+        # Each line is collected and joined once, rather than printed to a buffer.
+        print_ = lines.append
+        _print_header(print_, elapsed)
+        for section in ("stale", "run"):
+            scope_mapping = state.get(section)
+            if scope_mapping:
+                is_done = all(
+                    s.completed + s.failed == s.total for s in scope_mapping.values()
+                )
+                if not is_done or section not in self._skipped_sections:
+                    _print_section(print_, section, scope_mapping)
+                if is_done:
+                    self._skipped_sections.add(section)
+                else:
+                    self._skipped_sections.discard(section)
+        _print_new_exceptions(print_, new_exception_index, exception_tuples)
+        lines.append("")
+        return "\n".join(lines)
 
     def _output(self, value):
         print(value, end="", flush=True)
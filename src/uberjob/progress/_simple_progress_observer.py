@@ -16,6 +16,7 @@
 import threading
 import time
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 from uberjob.progress._progress_observer import ProgressObserver
 
@@ -35,6 +36,8 @@ def get_scope_string(scope, *, add_zero_width_spaces=False):
     return scope_string
 
 
+# Most scopes are unchanged between renders, so their strings are reused.
+@lru_cache(4096)
 def _get_progress_string(*, completed, failed, running, total):
     all_done = completed + failed == total
     started = completed + failed + running > 0
@@ -48,7 +51,11 @@ def _get_progress_string(*, completed, failed, running, total):
 
 
 def get_elapsed_string(elapsed: float) -> str:
-    elapsed = int(elapsed)
+    return _get_elapsed_string(int(elapsed))
+
+
+@lru_cache(4096)
+def _get_elapsed_string(elapsed: int) -> str:
     total_hours = elapsed // 3600
     minutes = (elapsed % 3600) // 60
     seconds = elapsed % 60
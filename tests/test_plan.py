@@ -18,14 +18,16 @@ import os
 import pathlib
 import pickle
 import re
+import sys
 import tempfile
+import weakref
 
 import networkx as nx
 
 import uberjob
 from uberjob._errors import NodeError
 from uberjob._util.traceback import get_stack_frame
-from uberjob.graph import Call
+from uberjob.graph import Call, Dependency, KeywordArg, PositionalArg
 from uberjob.progress import console_progress, default_progress, html_progress
 
 from .util import UberjobTestCase, copy_with_line_offset
@@ -91,6 +93,36 @@ class PlanTestCase(UberjobTestCase):
         self.assertEqual(uberjob.run(p, output=[]), [])
         self.assertEqual(uberjob.run(p, output=dict()), dict())
 
+    def test_structured_output_types(self):
+        p = uberjob.Plan()
+        x = p.call(lambda: 1)
+        result = uberjob.run(
+            p, output={"a": (x, [x, {x}]), "b": (1, [2]), "c": [x, ()]}
+        )
+        self.assertEqual(result, {"a": (1, [1, {1}]), "b": (1, [2]), "c": [1, ()]})
+        self.assertIs(type(result), dict)
+        self.assertIs(type(result["a"]), tuple)
+        self.assertIs(type(result["a"][1]), list)
+        self.assertIs(type(result["a"][1][1]), set)
+        self.assertIs(type(result["b"]), tuple)
+        self.assertIs(type(result["b"][1]), list)
+        self.assertIs(type(result["c"][1]), tuple)
+
+    def test_deeply_nested_output(self):
+        p = uberjob.Plan()
+        x = p.call(lambda: 1)
+        depth = sys.getrecursionlimit() + 100
+        output = x
+        for i in range(depth):
+            output = [output] if i % 2 else (output,)
+        result = uberjob.run(p, output=output)
+        # Unwrapped iteratively, since comparing such deep containers would itself exceed the recursion limit.
+        for i in reversed(range(depth)):
+            self.assertIs(type(result), list if i % 2 else tuple)
+            self.assertEqual(len(result), 1)
+            (result,) = result
+        self.assertEqual(result, 1)
+
     def test_latest_key_wins_in_dict_collisions(self):
         p = uberjob.Plan()
         x = {"a": 1, "b": 2, "c": 3}
@@ -390,6 +422,23 @@ class PlanTestCase(UberjobTestCase):
         self.assertIsInstance(unpickled_exception, uberjob.CallError)
         self.assertIsInstance(unpickled_exception.call, Call)
         self.assertIs(unpickled_exception.call.fn, operator.truediv)
+        self.assertEqual(str(unpickled_exception), str(exception))
+
+    def test_call_error_message(self):
+        plan = uberjob.Plan()
+        call = plan.call(operator.truediv, 1, 0)
+        with self.assertRaises(uberjob.CallError) as context:
+            uberjob.run(plan, output=call)
+        message = str(context.exception)
+        self.assertTrue(
+            message.startswith("An exception was raised in a symbolic call to truediv.")
+        )
+        self.assertIn("Symbolic traceback", message)
+        self.assertEqual(context.exception.args, (message,))
+        self.assertEqual(repr(context.exception), f"CallError({message!r})")
+        context.exception.args = ("overridden",)
+        self.assertEqual(str(context.exception), "overridden")
+        self.assertEqual(repr(context.exception), "CallError('overridden')")
 
     def test_serialize_node_error(self):
         plan = uberjob.Plan()
@@ -405,3 +454,33 @@ class PlanTestCase(UberjobTestCase):
         self.assertIsInstance(unpickled_exception, NodeError)
         self.assertIsInstance(unpickled_exception.node, Call)
         self.assertIs(unpickled_exception.node.fn, pow)
+
+    def test_serialize_graph(self):
+        plan = uberjob.Plan()
+        call = plan.call(pow, 2, exp=plan.call(operator.add, 1, 2))
+        unpickled_plan = uberjob.Plan()
+        unpickled_plan.graph = pickle.loads(pickle.dumps(plan.graph))
+        (unpickled_call,) = (
+            node
+            for node in unpickled_plan.graph
+            if isinstance(node, Call) and node.fn is pow
+        )
+        self.assertEqual(uberjob.run(plan, output=call), 8)
+        self.assertEqual(uberjob.run(unpickled_plan, output=unpickled_call), 8)
+
+    def test_plan_weakref_and_attributes(self):
+        plan = uberjob.Plan()
+        self.assertIs(weakref.ref(plan)(), plan)
+        plan.name = "example"
+        self.assertEqual(plan.name, "example")
+
+    def test_dependency_singleton(self):
+        self.assertIs(Dependency(), Dependency())
+        self.assertIs(pickle.loads(pickle.dumps(Dependency())), Dependency())
+        with self.assertRaises(TypeError):
+            Dependency(1)
+        self.assertIsNot(PositionalArg(0), PositionalArg(0))
+        self.assertEqual(pickle.loads(pickle.dumps(PositionalArg(0))), PositionalArg(0))
+        self.assertEqual(
+            pickle.loads(pickle.dumps(KeywordArg("x", 0))), KeywordArg("x", 0)
+        )
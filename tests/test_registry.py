@@ -16,13 +16,17 @@
 import datetime as dt
 import itertools
 import operator
+import weakref
+from unittest import mock
 
 import networkx as nx
 
 import uberjob
+from uberjob import _registry
 from uberjob._testing import TestStore
 from uberjob._util import Missing
 from uberjob._util.traceback import get_stack_frame
+from uberjob.graph import Literal
 
 from .util import UberjobTestCase, copy_with_line_offset
 
@@ -297,6 +301,23 @@ class RegistryTestCase(UberjobTestCase):
         ):
             uberjob.run(plan, registry=registry, output=x)
 
+    def test_stack_frame_capture_disabled(self):
+        plan = uberjob.Plan()
+        registry = uberjob.Registry()
+        with mock.patch.object(_registry, "CAPTURE_STACK_FRAMES", False):
+            x = registry.source(plan, TestStore())
+        self.assertIsNone(registry.mapping[x].stack_frame)
+        with self.assert_failed_to_read_from_empty_store():
+            try:
+                uberjob.run(plan, registry=registry, output=x)
+            except uberjob.CallError as e:
+                self.assertIsNone(e.call.stack_frame)
+                self.assertEqual(
+                    str(e).splitlines()[-1],
+                    "Symbolic traceback (most recent call last):",
+                )
+                raise
+
     def test_has_a_cycle(self):
         plan = uberjob.Plan()
         registry = uberjob.Registry()
@@ -337,9 +358,9 @@ class RegistryTestCase(UberjobTestCase):
         registry.add(x, TestStore())
         registry_copy = registry.copy()
         registry_copy.add(y, TestStore())
-        registry_copy.mapping[x].is_source = True
+        registry_copy.mapping[x].stack_frame = None
 
-        self.assertFalse(registry.mapping[x].is_source)
+        self.assertIsNotNone(registry.mapping[x].stack_frame)
         self.assertNotIn(y, registry)
         self.assertIn(x, registry_copy)
         self.assertEqual(registry[x], registry_copy[x])
@@ -402,3 +423,44 @@ class RegistryTestCase(UberjobTestCase):
             expected_exception_chain_traceback_summary=[["_to_naive_utc_time"]]
         ):
             uberjob.run(plan, registry=registry, output=node)
+
+    def test_registry_weakref_and_attributes(self):
+        registry = uberjob.Registry()
+        self.assertIs(weakref.ref(registry)(), registry)
+        registry.name = "example"
+        self.assertEqual(registry.name, "example")
+
+    def test_registry_values_and_items(self):
+        plan = uberjob.Plan()
+        registry = uberjob.Registry()
+        store = TestStore(5)
+        node = registry.source(plan, store)
+        self.assertEqual(registry.values(), [store])
+        self.assertEqual(registry.items(), [(node, store)])
+        self.assertEqual(len(registry.values()), 1)
+        self.assertEqual(len(registry.items()), 1)
+
+    def test_shared_value_store_literals(self):
+        plan = uberjob.Plan()
+        registry = uberjob.Registry()
+        store = TestStore(5)
+        with plan.scope("a"):
+            x = registry.source(plan, store)
+            y = registry.source(plan, store)
+        with plan.scope("b"):
+            z = registry.source(plan, store)
+        physical_plan, _ = uberjob.run(
+            plan, registry=registry, output=[x, y, z], dry_run=True
+        )
+        store_literals = [
+            node
+            for node in physical_plan.graph
+            if isinstance(node, Literal) and node.value is store
+        ]
+        self.assertCountEqual([node.scope for node in store_literals], [("a",), ("b",)])
+        self.assertEqual(store.read_count, 0)
+        self.assertEqual(
+            uberjob.run(plan, registry=registry, output=[x, y, z]), [5, 5, 5]
+        )
+        self.assertEqual(store.read_count, 3)
+        self.assertEqual(store.write_count, 0)
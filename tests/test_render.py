@@ -14,7 +14,9 @@
 # limitations under the License.
 #
 import uberjob
+from uberjob._rendering import default_style
 from uberjob._testing import TestStore
+from uberjob.graph import Node
 
 
 def add(x, y):
@@ -52,3 +54,13 @@ def test_render_level():
         x = plan.call(add, 2, 3)
     plan.call(add, x, 4)
     uberjob.render(plan, level=1, format="svg")
+
+
+def test_default_style_unknown_node_type():
+    class OtherNode(Node):
+        __slots__ = ()
+
+    style = default_style()
+    node_style = style.node(OtherNode(), {})
+    assert "fillcolor" not in node_style
+    assert "label" not in node_style
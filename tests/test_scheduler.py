@@ -23,10 +23,20 @@ import random
 from functools import reduce
 from unittest import TestCase
 
+import networkx as nx
+
 import uberjob
-from uberjob._execution.run_function_on_graph import run_function_on_graph
+from uberjob._errors import NodeError
+from uberjob._execution.run_function_on_graph import (
+    DONE,
+    run_function_on_graph,
+    worker_pool,
+    worker_thread,
+)
 from uberjob._execution.run_physical import prep_run_physical
+from uberjob._execution.scheduler import FifoQueue, RandomQueue
 from uberjob._testing import TestStore
+from uberjob.graph import Dependency
 
 
 class BigData:
@@ -207,3 +217,150 @@ class SchedulerTestCase(TestCase):
             (create_zipper(plan, registry, inspector.foo, 8) for _ in range(8)),
         )
         self.assert_max_big_datas(plan, registry, inspector, 2)
+
+    def test_rerun_rewired_graph(self):
+        graph = nx.MultiDiGraph()
+        graph.add_edge("a", "b", Dependency())
+        graph.add_edge("c", "d", Dependency())
+        run_function_on_graph(graph, lambda node: None, worker_count=1)
+        # The node and edge counts are unchanged, but b now depends on d.
+        graph.remove_edge("a", "b", Dependency())
+        graph.add_edge("d", "b", Dependency())
+        order = []
+        run_function_on_graph(graph, order.append, worker_count=1, scheduler="cheap")
+        self.assertCountEqual(order, ["a", "b", "c", "d"])
+        self.assertLess(order.index("d"), order.index("b"))
+
+    def test_rerun_graph_with_new_cycle(self):
+        graph = nx.MultiDiGraph()
+        graph.add_edge(1, 2, Dependency())
+        graph.add_edge(2, 3, Dependency())
+        run_function_on_graph(graph, lambda node: None, worker_count=1)
+        # The node and edge counts are unchanged, but 2 and 3 now form a cycle.
+        graph.remove_edge(1, 2, Dependency())
+        graph.add_edge(3, 2, Dependency())
+        with self.assertRaises(nx.HasACycle):
+            run_function_on_graph(graph, lambda node: None, worker_count=1)
+
+
+def drain(queue):
+    items = []
+    while not queue.empty():
+        items.append(queue.get())
+    return items
+
+
+class WorkQueueTestCase(TestCase):
+    queue_types = [FifoQueue, RandomQueue]
+
+    def test_get_batch(self):
+        for queue_type in self.queue_types:
+            with self.subTest(queue_type=queue_type):
+                queue = queue_type(range(10))
+                # 10 ready items for 1 worker gives a batch of 10 // 4.
+                first_batch = queue.get_batch(1)
+                self.assertEqual(len(first_batch), 2)
+                # 8 ready items for 4 workers is less than a full batch, so a single item is returned.
+                second_batch = queue.get_batch(4)
+                self.assertEqual(len(second_batch), 1)
+                self.assertCountEqual(
+                    [*first_batch, *second_batch, *drain(queue)], range(10)
+                )
+
+    def test_task_done_count(self):
+        for queue_type in self.queue_types:
+            with self.subTest(queue_type=queue_type):
+                queue = queue_type(range(10))
+                queue.put_many([10, 11])
+                batch = queue.get_batch(1)
+                queue.task_done(len(batch))
+                queue.task_done(len(drain(queue)))
+                queue.join()
+                with self.assertRaises(ValueError):
+                    queue.task_done(1)
+
+    def test_done_is_handed_back(self):
+        for queue_type in self.queue_types:
+            with self.subTest(queue_type=queue_type):
+                queue = queue_type([DONE] * 8)
+                processed = []
+                # The worker takes two sentinels in one batch, keeps one, and hands the other back.
+                worker_thread(queue, processed.append, 1).join()
+                remaining = drain(queue)
+                self.assertEqual(processed, [])
+                self.assertEqual(remaining, [DONE] * 7)
+                queue.task_done(len(remaining))
+                queue.join()
+
+    def test_done_reaches_every_worker(self):
+        for queue_type in self.queue_types:
+            with self.subTest(queue_type=queue_type):
+                worker_count = 4
+                queue = queue_type(range(100))
+                processed = []
+                with worker_pool(queue, processed.append, worker_count):
+                    queue.join()
+                    queue.put_many([DONE] * worker_count)
+                # Leaving the pool joins every worker, so each one received a sentinel.
+                self.assertCountEqual(processed, range(100))
+                self.assertEqual(drain(queue), [])
+
+
+def create_independent_nodes_graph(count):
+    graph = nx.MultiDiGraph()
+    graph.add_nodes_from(range(count))
+    return graph
+
+
+class InlineRunTestCase(TestCase):
+    """A single worker runs the nodes on the calling thread."""
+
+    def test_max_errors_stops_run(self):
+        graph = create_independent_nodes_graph(10)
+        attempted = []
+
+        def fn(node):
+            attempted.append(node)
+            raise ValueError(node)
+
+        with self.assertRaises(NodeError) as context:
+            run_function_on_graph(
+                graph, fn, worker_count=1, max_errors=2, scheduler="cheap"
+            )
+        # The third failure exceeds max_errors, so no further nodes are attempted.
+        self.assertEqual(attempted, [0, 1, 2])
+        self.assertEqual(context.exception.node, 0)
+        self.assertIsInstance(context.exception.__cause__, ValueError)
+        self.assertEqual(context.exception.__cause__.args, (0,))
+
+    def test_first_error_is_recorded(self):
+        graph = create_independent_nodes_graph(5)
+        attempted = []
+
+        def fn(node):
+            attempted.append(node)
+            if node in (1, 3):
+                raise ValueError(node)
+
+        with self.assertRaises(NodeError) as context:
+            run_function_on_graph(
+                graph, fn, worker_count=1, max_errors=None, scheduler="cheap"
+            )
+        self.assertEqual(attempted, [0, 1, 2, 3, 4])
+        self.assertEqual(context.exception.node, 1)
+        self.assertEqual(context.exception.__cause__.args, (1,))
+
+    def test_keyboard_interrupt_propagates(self):
+        graph = create_independent_nodes_graph(5)
+        attempted = []
+
+        def fn(node):
+            attempted.append(node)
+            if node == 2:
+                raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            run_function_on_graph(
+                graph, fn, worker_count=1, max_errors=None, scheduler="cheap"
+            )
+        self.assertEqual(attempted, [0, 1, 2])
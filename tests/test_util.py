@@ -15,8 +15,11 @@
 #
 from unittest import TestCase
 
+import networkx as nx
+
 from uberjob._builtins import gather_dict, gather_list, gather_set, gather_tuple, source
 from uberjob._util import fully_qualified_name
+from uberjob._util.networkx_util import induced_subgraph
 
 
 def function1():
@@ -33,6 +36,13 @@ class Function3:
         pass
 
 
+class UnhashableFunction4:
+    __hash__ = None
+
+    def __call__(self):
+        pass
+
+
 class UtilTestCase(TestCase):
     def test_fully_qualified_name(self):
         cases = [
@@ -40,6 +50,10 @@ class UtilTestCase(TestCase):
             (function1, "{}.{}".format(self.__module__, "function1")),
             (Widget().function2, "{}.{}".format(self.__module__, "Widget.function2")),
             (Function3(), "{}.{}".format(self.__module__, "Function3")),
+            (
+                UnhashableFunction4(),
+                "{}.{}".format(self.__module__, "UnhashableFunction4"),
+            ),
             *(
                 (fn, fn.__name__)
                 for fn in [
@@ -55,3 +69,39 @@ class UtilTestCase(TestCase):
         for fn, expected in cases:
             with self.subTest(fn=fn, expected=expected):
                 self.assertEqual(fully_qualified_name(fn), expected)
+
+    def test_induced_subgraph(self):
+        graph = nx.MultiDiGraph(name="example")
+        graph.add_nodes_from((i, {"weight": i}) for i in [5, 3, 8, 1, 9, 2, 7])
+        graph.add_edge(5, 3, "a", color="red")
+        graph.add_edge(5, 3, "b")
+        graph.add_edge(8, 1, "c")
+        graph.add_edge(3, 9, "d", color="blue")
+        graph.add_edge(9, 2, "e")
+        graph.add_edge(2, 7, "f")
+        graph.add_edge(7, 5, "g")
+        for nodes in [{5, 3, 9}, {7, 5, 3, 9, 2}, set(graph), set()]:
+            with self.subTest(nodes=nodes):
+                subgraph = induced_subgraph(graph, nodes)
+                expected = graph.subgraph(nodes).copy()
+                self.assertIs(type(subgraph), type(graph))
+                self.assertEqual(subgraph.graph, expected.graph)
+                self.assertEqual(
+                    list(subgraph.nodes(data=True)),
+                    [(u, d) for u, d in graph.nodes(data=True) if u in nodes],
+                )
+                self.assertEqual(
+                    dict(subgraph.nodes(data=True)), dict(expected.nodes(data=True))
+                )
+                self.assertEqual(
+                    list(subgraph.edges(keys=True, data=True)),
+                    [
+                        (u, v, k, d)
+                        for u, v, k, d in graph.edges(keys=True, data=True)
+                        if u in nodes and v in nodes
+                    ],
+                )
+                self.assertCountEqual(
+                    subgraph.edges(keys=True, data=True),
+                    expected.edges(keys=True, data=True),
+                )
@@ -21,7 +21,7 @@ from functools import partial
 from tempfile import TemporaryDirectory
 from unittest import TestCase
 
-from uberjob._testing import TestMountedFileStore
+from uberjob._testing import TestMountedFileStore, TestStore
 from uberjob.stores import (
     BinaryFileStore,
     FileStore,
@@ -146,6 +146,15 @@ class ValueStoresTestCase(TestCase):
                 with TemporaryDirectory() as tempdir:
                     self._staged_write_path_helper(tempdir, use_pathlib_path)
 
+    def test_test_store_fake_clock(self):
+        stores = [TestStore(use_fake_clock=True) for _ in range(3)]
+        for store in stores:
+            store.write(1)
+        modified_times = [store.get_modified_time() for store in stores]
+        self.assertEqual(modified_times, sorted(set(modified_times)))
+        stores[0].write(2)
+        self.assertGreater(stores[0].get_modified_time(), modified_times[-1])
+
     def test_touch_file_store(self):
         with TemporaryDirectory() as tempdir:
             p = os.path.join(tempdir, "myfile")